@@ -5,6 +5,6 @@ This package contains the orchestrator and symbol analysis flows.
 """
 
 from flows.orchestrator_flow import trading_orchestrator
-from flows.analyze_symbol_flow import analyze_symbol
+from flows.analyze_symbol_flow import analyze_symbol, analyze_symbols_batch
 
-__all__ = ["trading_orchestrator", "analyze_symbol"]
+__all__ = ["trading_orchestrator", "analyze_symbol", "analyze_symbols_batch"]
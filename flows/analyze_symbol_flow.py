@@ -1,14 +1,80 @@
 """
-Symbol-level flow for analyzing a single contract across all timestamps.
-Processes all time slices with market context (VIX, SPX, beta calculation).
+Symbol-level flows for analyzing contracts across all timestamps.
+Processes all time slices with market context (VIX, SPX, beta calculation),
+either one contract per flow run or a batch of contracts in one vectorized pass.
 """
 
+import asyncio
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import numpy as np
 import pandas as pd
 from prefect import flow, task
 from prefect.artifacts import create_table_artifact
 from prefect.runtime import flow_run as runtime_flow_run
 from prefect_aws import S3Bucket
 
+from flows.parquet_io import read_parquet
+
+# The numba kernel is opt-in (TRADING_DEMO_JIT=1). Importing numba and loading
+# the kernel costs ~0.5 s per process even from a warm on-disk cache (seconds
+# when it has to compile), so the default per-symbol runs stay on NumPy
+njit = None
+if os.environ.get("TRADING_DEMO_JIT", "").lower() in ("1", "true", "yes"):
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; fall back to the NumPy implementation
+        njit = None
+
+# Input data in S3 (read-only, shared by every analysis flow)
+HOLDINGS_PATH = "s3://se-demo-raw-data-files/spx_holdings_hourly.parquet"
+VIX_PATH = "s3://se-demo-raw-data-files/vix_hourly.parquet"
+SPX_PATH = "s3://se-demo-raw-data-files/spx_hourly.parquet"
+
+# VIX level at which signal thresholds are +/-0.5%
+BASE_VIX = 15.0
+
+# Label columns are stored as categoricals over these fixed categories
+SIGNALS = ["hold", "buy", "sell"]
+TRADE_QUALITIES = ["neutral", "good", "bad"]
+_HOLD, _BUY, _SELL = (SIGNALS.index(name) for name in ("hold", "buy", "sell"))
+_NEUTRAL, _GOOD, _BAD = (
+    TRADE_QUALITIES.index(name) for name in ("neutral", "good", "bad")
+)
+
+# The kernel saves ~30 ns per price cell over NumPy, so it only repays its
+# loading cost above ~16M cells (timestamps x contracts): large batches, never a
+# single contract (48k rows)
+JIT_MIN_CELLS = 20_000_000
+
+# Maximum number of contracts saved at once by the batch flow; each save loads
+# the results block, uploads a file and creates an artifact, so stay within the
+# same API rate limits as the orchestrator's MAX_CONCURRENT_TRIGGERS
+MAX_CONCURRENT_SAVES = 32
+
+# Market columns in the batch frame; prefixed so they can't clash with a
+# holdings column such as "SPX" requested as a contract
+BATCH_VIX_COLUMN = "market_VIX"
+BATCH_SPX_COLUMN = "market_SPX"
+
+# Analysis results are re-read from S3, so favour fewer bytes: zstd level 1
+# compresses better than snappy at similar decode speed, and only the
+# low-cardinality label columns are dictionary encoded. Results are written in
+# timestamp order, so the min/max statistics let readers prune by time range
+RESULT_PARQUET_OPTIONS = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 1,
+    "row_group_size": 256_000,
+    "data_page_size": 1024 * 1024,
+    "use_dictionary": ["contract", "signal", "trade_quality"],
+    "write_statistics": True,
+    "index": False,
+}
+
 
 @task(tags=["load"], log_prints=False)
 def load_contract_with_market_data(
@@ -26,19 +92,25 @@ def load_contract_with_market_data(
     Returns:
         DataFrame with contract prices, VIX, and SPX
     """
-    # Load contract prices
-    df = pd.read_parquet(parquet_path)
+    # Fetch prices, VIX and SPX concurrently - the three reads are independent
+    # and each projects a single column, so the other holdings are never read.
+    # VIX and SPX are the same for every contract, so they are cached per process
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        df_future = executor.submit(read_parquet, parquet_path, [contract])
+        vix_future = executor.submit(read_parquet, vix_path, ["VIX"], cache=True)
+        spx_future = executor.submit(read_parquet, spx_path, ["SPX"], cache=True)
+        df = df_future.result()
+        vix_df, spx_df = vix_future.result(), spx_future.result()
+
+    # Contract prices
     df_contract = df[[contract]].copy()
     df_contract = df_contract.rename(columns={contract: "price"})
-    df_contract["contract"] = contract
-
-    # Load VIX
-    vix_df = pd.read_parquet(vix_path)
-    df_contract = df_contract.join(vix_df["VIX"], how="left")
+    df_contract["contract"] = pd.Categorical.from_codes(
+        np.zeros(len(df_contract), dtype=np.int8), categories=[contract]
+    )
 
-    # Load SPX
-    spx_df = pd.read_parquet(spx_path)
-    df_contract = df_contract.join(spx_df["SPX"], how="left")
+    # Join VIX and SPX in a single multi-frame join (one reindex, not two)
+    df_contract = df_contract.join([vix_df[["VIX"]], spx_df[["SPX"]]], how="left")
 
     # Reset index to make timestamp a column
     df_contract = df_contract.reset_index()
@@ -47,6 +119,212 @@ def load_contract_with_market_data(
     return df_contract
 
 
+def _pct_change(values: np.ndarray) -> np.ndarray:
+    """Percent change from the previous row (NaN for the first), like pct_change."""
+    pct = np.full_like(values, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct[1:] = values[1:] / values[:-1] - 1
+    return pct * 100
+
+
+def _market_context_arrays(price: np.ndarray, spx: np.ndarray, vix: np.ndarray):
+    """
+    Compute the analysis columns for one or many contracts as NumPy arrays.
+
+    Args:
+        price: Prices of one contract, shape (T,), or of K contracts sharing
+            the same timestamps, shape (T, K)
+        spx: SPX level per timestamp, shape (T,)
+        vix: VIX level per timestamp, shape (T,)
+
+    Returns:
+        Dict of analysis columns in output order. Market-only columns keep the
+        market's shape; signal and trade_quality are int8 category codes
+    """
+    if njit is not None and price.size >= JIT_MIN_CELLS:
+        return _market_context_arrays_jit(price, spx, vix)
+
+    if price.ndim == 2:
+        # Broadcast market series across the contract axis
+        spx, vix = spx[:, None], vix[:, None]
+    columns = {}
+
+    # Calculate price changes
+    price_change = np.full_like(price, np.nan)
+    price_change[1:] = price[1:] - price[:-1]
+    price_change_pct = _pct_change(price)
+    columns["price_change"] = price_change
+    columns["price_change_pct"] = price_change_pct
+
+    # Calculate SPX changes for beta
+    spx_change_pct = _pct_change(spx)
+    columns["spx_change_pct"] = spx_change_pct
+
+    # Calculate beta (simplified - stock change / market change)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = price_change_pct / spx_change_pct
+    beta[np.isnan(beta)] = 1.0  # Neutral beta when undefined
+    np.clip(beta, -3, 3, out=beta)  # Clip extreme values
+    columns["beta"] = beta
+
+    # Volatility-adjusted signal thresholds
+    # Higher VIX = more conservative (higher thresholds)
+    vix_multiplier = vix / BASE_VIX
+    buy_threshold = 0.5 * vix_multiplier
+    sell_threshold = -0.5 * vix_multiplier
+    columns["vix_multiplier"] = vix_multiplier
+    columns["buy_threshold"] = buy_threshold
+    columns["sell_threshold"] = sell_threshold
+
+    # Generate trading signals (sell wins if both thresholds are crossed)
+    signal_codes = np.select(
+        [
+            price_change_pct < sell_threshold,
+            price_change_pct > buy_threshold,
+        ],
+        [_SELL, _BUY],
+        default=_HOLD,
+    ).astype(np.int8)
+    columns["signal"] = signal_codes
+
+    # Evaluate trade quality against the following bar's move
+    next_change = np.empty_like(price_change_pct)
+    next_change[:-1] = price_change_pct[1:]
+    next_change[-1:] = np.nan
+    columns["next_price_change_pct"] = next_change
+    is_buy = signal_codes == _BUY
+    is_sell = signal_codes == _SELL
+
+    # Good: buy before a rise or sell before a fall; bad: the opposite
+    columns["trade_quality"] = np.select(
+        [
+            (is_buy & (next_change > 0)) | (is_sell & (next_change < 0)),
+            (is_buy & (next_change < 0)) | (is_sell & (next_change > 0)),
+        ],
+        [_GOOD, _BAD],
+        default=_NEUTRAL,
+    ).astype(np.int8)
+
+    return columns
+
+
+def _market_context_arrays_jit(price: np.ndarray, spx: np.ndarray, vix: np.ndarray):
+    """Numba-backed equivalent of _market_context_arrays (same keys and shapes)."""
+    market_shape = (len(price), 1) if price.ndim == 2 else (len(price),)
+    vix_multiplier = vix / BASE_VIX
+    buy_threshold = 0.5 * vix_multiplier
+    sell_threshold = -0.5 * vix_multiplier
+
+    (
+        price_change,
+        price_change_pct,
+        spx_change_pct,
+        beta,
+        signal_codes,
+        next_change,
+        quality_codes,
+    ) = _market_context_kernel(
+        price.reshape(len(price), -1), spx, buy_threshold, sell_threshold
+    )
+
+    return {
+        "price_change": price_change.reshape(price.shape),
+        "price_change_pct": price_change_pct.reshape(price.shape),
+        "spx_change_pct": spx_change_pct.reshape(market_shape),
+        "beta": beta.reshape(price.shape),
+        "vix_multiplier": vix_multiplier.reshape(market_shape),
+        "buy_threshold": buy_threshold.reshape(market_shape),
+        "sell_threshold": sell_threshold.reshape(market_shape),
+        "signal": signal_codes.reshape(price.shape),
+        "next_price_change_pct": next_change.reshape(price.shape),
+        "trade_quality": quality_codes.reshape(price.shape),
+    }
+
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _market_context_kernel(price, spx, buy_threshold, sell_threshold):
+        """
+        Fused per-timestamp pass over a (T, K) price matrix.
+
+        Computes price changes, beta, signals and trade quality in one sweep
+        with the same arithmetic as the NumPy path, so results are identical.
+        """
+        n_rows, n_contracts = price.shape
+        price_change = np.empty((n_rows, n_contracts))
+        price_change_pct = np.empty((n_rows, n_contracts))
+        spx_change_pct = np.empty(n_rows)
+        beta = np.empty((n_rows, n_contracts))
+        signal_codes = np.empty((n_rows, n_contracts), dtype=np.int8)
+        next_change = np.empty((n_rows, n_contracts))
+        quality_codes = np.empty((n_rows, n_contracts), dtype=np.int8)
+
+        for t in prange(n_rows):
+            spx_pct = (spx[t] / spx[t - 1] - 1) * 100 if t > 0 else np.nan
+            spx_change_pct[t] = spx_pct
+
+            for k in range(n_contracts):
+                if t > 0:
+                    change = price[t, k] - price[t - 1, k]
+                    pct = (price[t, k] / price[t - 1, k] - 1) * 100
+                else:
+                    change = np.nan
+                    pct = np.nan
+                if t + 1 < n_rows:
+                    nxt = (price[t + 1, k] / price[t, k] - 1) * 100
+                else:
+                    nxt = np.nan
+
+                # Neutral beta when undefined, then clip extreme values
+                b = pct / spx_pct
+                if np.isnan(b):
+                    b = 1.0
+                b = min(max(b, -3.0), 3.0)
+
+                # Sell wins if both thresholds are crossed
+                if pct < sell_threshold[t]:
+                    signal = _SELL
+                elif pct > buy_threshold[t]:
+                    signal = _BUY
+                else:
+                    signal = _HOLD
+
+                if (signal == _BUY and nxt > 0) or (signal == _SELL and nxt < 0):
+                    quality = _GOOD
+                elif (signal == _BUY and nxt < 0) or (signal == _SELL and nxt > 0):
+                    quality = _BAD
+                else:
+                    quality = _NEUTRAL
+
+                price_change[t, k] = change
+                price_change_pct[t, k] = pct
+                beta[t, k] = b
+                signal_codes[t, k] = signal
+                next_change[t, k] = nxt
+                quality_codes[t, k] = quality
+
+        return (
+            price_change,
+            price_change_pct,
+            spx_change_pct,
+            beta,
+            signal_codes,
+            next_change,
+            quality_codes,
+        )
+
+
+def _with_categorical_labels(columns: dict) -> dict:
+    """Wrap the signal and trade_quality codes as categoricals."""
+    columns = dict(columns)
+    columns["signal"] = pd.Categorical.from_codes(columns["signal"], categories=SIGNALS)
+    columns["trade_quality"] = pd.Categorical.from_codes(
+        columns["trade_quality"], categories=TRADE_QUALITIES
+    )
+    return columns
+
+
 @task(tags=["analyze"], log_prints=False)
 def analyze_with_market_context(contract: str, df: pd.DataFrame):
     """
@@ -59,54 +337,100 @@ def analyze_with_market_context(contract: str, df: pd.DataFrame):
     Returns:
         DataFrame with analysis including beta and volatility-adjusted signals
     """
-    df = df.copy()
-    df = df.sort_values("timestamp")
+    # Loaded data is already in timestamp order, so only sort when it isn't.
+    # The input is never modified: derived columns are collected and attached
+    # to a new frame in one concat to avoid block splits
+    if not df["timestamp"].is_monotonic_increasing:
+        df = df.sort_values("timestamp")
+
+    columns = _market_context_arrays(
+        df["price"].to_numpy(dtype=np.float64),
+        df["SPX"].to_numpy(dtype=np.float64),
+        df["VIX"].to_numpy(dtype=np.float64),
+    )
+    new_cols = _with_categorical_labels(columns)
 
-    # Calculate price changes
-    df["price_change"] = df["price"].diff()
-    df["price_change_pct"] = df["price"].pct_change(fill_method=None) * 100
+    return pd.concat([df, pd.DataFrame(new_cols, index=df.index)], axis=1)
 
-    # Calculate SPX changes for beta
-    df["spx_change_pct"] = df["SPX"].pct_change(fill_method=None) * 100
 
-    # Calculate beta (simplified - stock change / market change)
-    df["beta"] = df["price_change_pct"] / df["spx_change_pct"]
-    df["beta"] = df["beta"].fillna(1.0)  # Neutral beta when undefined
-    df["beta"] = df["beta"].clip(-3, 3)  # Clip extreme values
+@task(tags=["load"], log_prints=False)
+def load_contracts_with_market_data(
+    contracts: List[str], parquet_path: str, vix_path: str, spx_path: str
+):
+    """
+    Load several contracts' prices with market context (VIX and SPX).
 
-    # Volatility-adjusted signal thresholds
-    # Higher VIX = more conservative (higher thresholds)
-    base_vix = 15.0
-    df["vix_multiplier"] = df["VIX"] / base_vix
-    df["buy_threshold"] = 0.5 * df["vix_multiplier"]
-    df["sell_threshold"] = -0.5 * df["vix_multiplier"]
-
-    # Generate trading signals
-    df["signal"] = "hold"
-    df.loc[df["price_change_pct"] > df["buy_threshold"], "signal"] = "buy"
-    df.loc[df["price_change_pct"] < df["sell_threshold"], "signal"] = "sell"
-
-    # Evaluate trade quality
-    df["next_price_change_pct"] = df["price_change_pct"].shift(-1)
-    df["trade_quality"] = "neutral"
-
-    # Good trades
-    df.loc[
-        ((df["signal"] == "buy") & (df["next_price_change_pct"] > 0))
-        | ((df["signal"] == "sell") & (df["next_price_change_pct"] < 0)),
-        "trade_quality",
-    ] = "good"
-
-    # Bad trades
-    df.loc[
-        ((df["signal"] == "buy") & (df["next_price_change_pct"] < 0))
-        | ((df["signal"] == "sell") & (df["next_price_change_pct"] > 0)),
-        "trade_quality",
-    ] = "bad"
+    Args:
+        contracts: Stock contracts to analyze
+        parquet_path: Path to stock holdings parquet
+        vix_path: Path to VIX parquet
+        spx_path: Path to SPX parquet
 
+    Returns:
+        DataFrame indexed by timestamp with one price column per contract,
+        plus BATCH_VIX_COLUMN and BATCH_SPX_COLUMN
+    """
+    # One holdings read for the whole batch, projected to just these contracts
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        prices_future = executor.submit(read_parquet, parquet_path, contracts)
+        vix_future = executor.submit(read_parquet, vix_path, ["VIX"], cache=True)
+        spx_future = executor.submit(read_parquet, spx_path, ["SPX"], cache=True)
+        prices = prices_future.result()
+        vix_df, spx_df = vix_future.result(), spx_future.result()
+
+    market = [
+        vix_df[["VIX"]].rename(columns={"VIX": BATCH_VIX_COLUMN}),
+        spx_df[["SPX"]].rename(columns={"SPX": BATCH_SPX_COLUMN}),
+    ]
+    df = prices[contracts].join(market, how="left")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
     return df
 
 
+@task(tags=["analyze"], log_prints=False)
+def analyze_contracts_batch(contracts: List[str], df: pd.DataFrame):
+    """
+    Analyze several contracts at once with VIX-adjusted signals and beta.
+
+    The analysis runs once over a (timestamps x contracts) price matrix, so
+    every NumPy operation covers the whole batch.
+
+    Args:
+        contracts: Stock contracts
+        df: DataFrame from load_contracts_with_market_data
+
+    Returns:
+        Dict mapping each contract to a DataFrame with the same columns as
+        analyze_with_market_context produces
+    """
+    # Upcast only the copies the math runs on; the output keeps stored dtypes
+    prices = df[contracts].to_numpy(dtype=np.float64)
+    spx = df[BATCH_SPX_COLUMN].to_numpy(dtype=np.float64)
+    vix = df[BATCH_VIX_COLUMN].to_numpy(dtype=np.float64)
+    columns = _market_context_arrays(prices, spx, vix)
+
+    results = {}
+    for idx, contract in enumerate(contracts):
+        contract_columns = {
+            name: np.broadcast_to(values, prices.shape)[:, idx]
+            for name, values in columns.items()
+        }
+        results[contract] = pd.DataFrame(
+            {
+                "timestamp": df.index,
+                "price": df[contract].to_numpy(),
+                "contract": pd.Categorical.from_codes(
+                    np.zeros(len(df), dtype=np.int8), categories=[contract]
+                ),
+                "VIX": df[BATCH_VIX_COLUMN].to_numpy(),
+                "SPX": df[BATCH_SPX_COLUMN].to_numpy(),
+                **_with_categorical_labels(contract_columns),
+            }
+        )
+    return results
+
+
 @task(tags=["save"], log_prints=False)
 async def save_and_summarize(contract: str, df: pd.DataFrame, use_s3: bool = False):
     """
@@ -120,10 +444,13 @@ async def save_and_summarize(contract: str, df: pd.DataFrame, use_s3: bool = Fal
     Returns:
         Output path and summary stats
     """
-    # Calculate summary statistics
-    total_trades = len(df[df["signal"] != "hold"])
-    good_trades = len(df[df["trade_quality"] == "good"])
-    bad_trades = len(df[df["trade_quality"] == "bad"])
+    # Calculate summary statistics (one count pass per label column, without
+    # materialising filtered copies of the frame)
+    signal_counts = df["signal"].value_counts()
+    quality_counts = df["trade_quality"].value_counts()
+    total_trades = int(len(df) - signal_counts.get("hold", 0))
+    good_trades = int(quality_counts.get("good", 0))
+    bad_trades = int(quality_counts.get("bad", 0))
     success_rate = (good_trades / total_trades * 100) if total_trades > 0 else 0
     avg_beta = df["beta"].mean()
     avg_vix = df["VIX"].mean()
@@ -134,28 +461,19 @@ async def save_and_summarize(contract: str, df: pd.DataFrame, use_s3: bool = Fal
     if use_s3:
         # Use S3 block for results storage
         s3_block = await S3Bucket.load("trading-demo-results")
-        
-        # Write to temporary file then upload
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.parquet') as tmp:
-            df.to_parquet(tmp.name, engine="pyarrow", compression="snappy", index=False)
-            tmp_path = tmp.name
-        
-        # Upload to S3
-        s3_block.upload_from_path(from_path=tmp_path, to_path=filename)
-        
-        # Clean up temp file
-        import os
-        os.unlink(tmp_path)
-        
+
+        # Serialize in memory and upload the bytes directly (no temp file)
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, **RESULT_PARQUET_OPTIONS)
+        await s3_block.write_path(path=filename, content=buffer.getvalue())
+
         output_path = f"s3://{s3_block.bucket_name}/{s3_block.bucket_folder}/{filename}".replace("//", "/")
     else:
         # Save locally
-        import os
         output_dir = "output/test_results"
         os.makedirs(output_dir, exist_ok=True)
         output_path = f"{output_dir}/{filename}"
-        df.to_parquet(output_path, engine="pyarrow", compression="snappy", index=False)
+        df.to_parquet(output_path, **RESULT_PARQUET_OPTIONS)
 
     # Create artifact
     await create_table_artifact(
@@ -208,9 +526,6 @@ async def analyze_symbol(
     Returns:
         Summary statistics dictionary
     """
-    # Configuration - check if running locally or in K8s
-    import os
-    
     # Demo: Simulate failure on the 8th symbol (index 7) to showcase error handling
     if symbol_index == 7:
         flow_run_id = runtime_flow_run.id
@@ -223,17 +538,12 @@ async def analyze_symbol(
     # Detect environment: if /app exists, we're in K8s container
     is_k8s = os.path.exists("/app") and os.getcwd() == "/app"
 
-    # Always pull input data from S3 (using hardcoded paths since we're just reading)
-    parquet_path = "s3://se-demo-raw-data-files/spx_holdings_hourly.parquet"
-    vix_path = "s3://se-demo-raw-data-files/vix_hourly.parquet"
-    spx_path = "s3://se-demo-raw-data-files/spx_hourly.parquet"
-
     # Create contract-specific tags
     flow_tags = [f"contract:{contract}"]
 
-    # Task A: Load data with market context
+    # Task A: Load data with market context (always pulled from S3)
     df = load_contract_with_market_data.with_options(tags=flow_tags)(
-        contract, parquet_path, vix_path, spx_path
+        contract, HOLDINGS_PATH, VIX_PATH, SPX_PATH
     )
 
     # Task B: Analyze with VIX/SPX/beta
@@ -247,6 +557,57 @@ async def analyze_symbol(
     return result
 
 
+@flow(
+    name="analyze-symbols-batch",
+    flow_run_name="analyze-batch-{batch_index}",
+    persist_result=True,
+    log_prints=False,
+    result_storage="s3-bucket/trading-demo-results",
+)
+async def analyze_symbols_batch(
+    contracts: List[str],
+    batch_index: int = 0,
+):
+    """
+    Analyze a batch of contracts in one vectorized pass with market context.
+
+    Unlike running analyze_symbol per contract, the holdings file is read once
+    for the whole batch and beta/signals are computed for every contract with
+    the same array operations. Each contract's results are saved and
+    summarized exactly as analyze_symbol does.
+
+    Args:
+        contracts: Stock contracts to analyze
+        batch_index: Index of this batch (for flow run naming)
+
+    Returns:
+        Dictionary mapping each contract to its summary statistics
+    """
+    contracts = list(dict.fromkeys(contracts))
+
+    # Detect environment: if /app exists, we're in K8s container
+    is_k8s = os.path.exists("/app") and os.getcwd() == "/app"
+
+    # Task A: Load all contracts with market context (always pulled from S3)
+    df = load_contracts_with_market_data(contracts, HOLDINGS_PATH, VIX_PATH, SPX_PATH)
+
+    # Task B: Analyze the whole batch at once
+    analyzed = analyze_contracts_batch(contracts, df)
+
+    # Task C: Save and summarize each contract concurrently, bounded to respect
+    # API rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SAVES)
+
+    async def save(contract: str):
+        async with semaphore:
+            return await save_and_summarize.with_options(
+                tags=[f"contract:{contract}"]
+            )(contract, analyzed[contract], use_s3=is_k8s)
+
+    results = await asyncio.gather(*[save(contract) for contract in contracts])
+
+    return dict(zip(contracts, results))
+
+
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(analyze_symbol(contract="AAPL"))
@@ -1,31 +1,35 @@
 """Orchestrator flow that triggers parallel symbol analysis flows."""
 
-import pandas as pd
+import asyncio
 from typing import Optional
 from prefect import flow, task
 from prefect.deployments import run_deployment
 from prefect.artifacts import create_markdown_artifact
 from prefect_aws import S3Bucket
 
+from flows.parquet_io import read_parquet_summary
+
+# Maximum number of run_deployment calls in flight at once
+MAX_CONCURRENT_TRIGGERS = 32
+
 
 @task(log_prints=False)
 async def load_and_partition_data(num_contracts: Optional[int] = None):
-    """Load parquet data and extract contract list."""
+    """Extract the contract list and timestamp count from the parquet footer."""
     s3_block = await S3Bucket.load("trading-demo-input")
     s3_path = f"s3://{s3_block.bucket_name}/spx_holdings_hourly.parquet"
-    df = pd.read_parquet(s3_path)
+    columns, total_timestamps = read_parquet_summary(s3_path)
 
-    all_contracts = [col for col in df.columns if col != "SPX"]
+    all_contracts = [col for col in columns if col != "SPX"]
     contracts = all_contracts[:num_contracts] if num_contracts else all_contracts
-    total_timestamps = len(df.index.unique())
 
     return contracts, total_timestamps, s3_path
 
 
 @task(log_prints=False)
-def trigger_symbol_analysis(contract: str, symbol_index: int):
+async def trigger_symbol_analysis(contract: str, symbol_index: int):
     """Trigger a symbol analysis flow for a specific contract."""
-    flow_run = run_deployment(
+    flow_run = await run_deployment(
         name="analyze-symbol/analyze-symbol",
         parameters={"contract": contract, "symbol_index": symbol_index},
         timeout=0,
@@ -49,9 +53,11 @@ async def trading_orchestrator(num_contracts: int = 10):
     """Orchestrate the trading pipeline across parallel symbol flows."""
     contracts, total_timestamps, parquet_path = await load_and_partition_data(num_contracts)
 
-    await create_markdown_artifact(
-        key="orchestrator-summary",
-        markdown=f"""# Trading Pipeline Orchestration
+    # Publish the summary in the background so dispatch starts immediately
+    summary_artifact = asyncio.create_task(
+        create_markdown_artifact(
+            key="orchestrator-summary",
+            markdown=f"""# Trading Pipeline Orchestration
 
 **Orchestrator** → **{len(contracts)} Symbol Flows** (each processes {total_timestamps} timestamps)
 
@@ -60,13 +66,26 @@ async def trading_orchestrator(num_contracts: int = 10):
 - **Data**: `{parquet_path}`
 - **Contracts**: {', '.join(contracts[:20])}{'...' if len(contracts) > 20 else ''}
         """,
-        description="Trading pipeline orchestration summary",
+            description="Trading pipeline orchestration summary",
+        )
     )
 
-    flow_runs = []
-    for idx, contract in enumerate(contracts):
-        flow_run = trigger_symbol_analysis(contract=contract, symbol_index=idx)
-        flow_runs.append(flow_run)
+    # Trigger all symbol flows concurrently, bounded to respect API rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRIGGERS)
+
+    async def trigger(contract: str, symbol_index: int):
+        async with semaphore:
+            return await trigger_symbol_analysis(
+                contract=contract, symbol_index=symbol_index
+            )
+
+    try:
+        flow_runs = await asyncio.gather(
+            *[trigger(contract, idx) for idx, contract in enumerate(contracts)]
+        )
+    finally:
+        # Publish the summary even if a dispatch fails
+        await summary_artifact
 
     print(f"\n{'='*60}")
     print(f"✓ Triggered {len(flow_runs)} symbol flows")
@@ -78,5 +97,4 @@ async def trading_orchestrator(num_contracts: int = 10):
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(trading_orchestrator())
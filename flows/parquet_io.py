@@ -0,0 +1,116 @@
+"""
+Parquet read helpers shared by the trading flows.
+
+Reads go through pyarrow's native filesystems so S3 objects are fetched by
+libarrow's C++ thread pool instead of round-tripping through s3fs/fsspec.
+"""
+
+from functools import lru_cache
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+# Pre-buffer column chunks and coalesce nearby byte ranges so each file is
+# fetched with a few large ranged GETs rather than one request per chunk.
+PARQUET_FORMAT = ds.ParquetFileFormat(
+    default_fragment_scan_options=ds.ParquetFragmentScanOptions(
+        pre_buffer=True,
+        cache_options=pa.CacheOptions(
+            hole_size_limit=64 * 1024,
+            range_size_limit=16 * 1024 * 1024,
+        ),
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _s3_filesystem(bucket: str) -> pafs.S3FileSystem:
+    """Create one native S3 filesystem per bucket, in the bucket's own region."""
+    return pafs.S3FileSystem(region=pafs.resolve_s3_region(bucket))
+
+
+def resolve_path(path: str):
+    """
+    Split a parquet location into a pyarrow filesystem and a filesystem path.
+
+    Args:
+        path: Local path or s3:// URI
+
+    Returns:
+        Tuple of (filesystem, path); filesystem is None for local paths
+    """
+    if path.startswith("s3://"):
+        bucket_path = path[len("s3://") :]
+        return _s3_filesystem(bucket_path.split("/", 1)[0]), bucket_path
+    return None, path
+
+
+def read_parquet(path: str, columns=None, cache: bool = False) -> pd.DataFrame:
+    """
+    Read a parquet file (local or S3) into a DataFrame via pyarrow.dataset.
+
+    Args:
+        path: Local path or s3:// URI
+        columns: Optional list of columns to read (the stored index is always kept)
+        cache: Keep the Arrow table in memory so later reads of the same
+            path and columns in this process skip the fetch
+
+    Returns:
+        DataFrame with the stored pandas index restored
+    """
+    if cache:
+        columns = tuple(columns) if columns is not None else None
+        return _read_table_cached(path, columns).to_pandas()
+
+    # The table is discarded after conversion, so let pandas take its buffers
+    # column by column instead of holding both copies at peak
+    table = _read_table(path, columns)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _read_table(path: str, columns=None) -> pa.Table:
+    """Scan a parquet file into an Arrow table, projecting columns if given."""
+    filesystem, source = resolve_path(path)
+    dataset = ds.dataset(source, format=PARQUET_FORMAT, filesystem=filesystem)
+    if columns is not None:
+        # Like pd.read_parquet, keep the stored index when projecting columns
+        columns = _index_columns(dataset.schema) + list(columns)
+    return dataset.to_table(columns=columns, use_threads=True)
+
+
+@lru_cache(maxsize=8)
+def _read_table_cached(path: str, columns) -> pa.Table:
+    """Memoised _read_table; Arrow tables are immutable, so sharing is safe."""
+    return _read_table(path, columns)
+
+
+def read_parquet_summary(path: str):
+    """
+    Read a parquet file's data columns and row count from its footer only.
+
+    Args:
+        path: Local path or s3:// URI
+
+    Returns:
+        Tuple of (column names excluding the stored index, number of rows)
+    """
+    filesystem, source = resolve_path(path)
+    if filesystem is None:
+        metadata = pq.read_metadata(source)
+    else:
+        with filesystem.open_input_file(source) as f:
+            metadata = pq.read_metadata(f)
+
+    schema = metadata.schema.to_arrow_schema()
+    index_columns = set(_index_columns(schema))
+    columns = [name for name in schema.names if name not in index_columns]
+    return columns, metadata.num_rows
+
+
+def _index_columns(schema) -> list:
+    """Return the names of pandas index columns stored in a parquet schema."""
+    metadata = schema.pandas_metadata or {}
+    return [col for col in metadata.get("index_columns", []) if isinstance(col, str)]
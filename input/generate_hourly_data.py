@@ -5,100 +5,182 @@ Converts daily closing prices to hourly prices during trading hours (9:30 AM - 4
 using linear interpolation between consecutive days.
 """
 
+import os
+import sys
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, time
-import pytz
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from datetime import time
+from typing import List, Optional
+
+# Trading hours in EST
+TRADING_HOURS = [
+    time(9, 30),  # Market open
+    time(10, 30),
+    time(11, 30),
+    time(12, 30),
+    time(13, 30),
+    time(14, 30),
+    time(15, 30),
+    time(16, 0),  # Market close
+]
+
+# Row-group size for the single-column VIX/SPX files, where small cache-sized
+# groups cost nothing. The wide holdings file keeps pyarrow's default (one group
+# per ~1M rows) so each contract's column stays one contiguous chunk: the flows
+# read a single column, and a small footer, from it
+INDEX_ROW_GROUP_SIZE = 8192
+
+
+def _hourly_index(dates: pd.Series) -> pd.DatetimeIndex:
+    """
+    Build the timezone-aware timestamp index for every (day, trading hour) pair.
+
+    Args:
+        dates: Trading days, in order
+
+    Returns:
+        DatetimeIndex named "timestamp" with len(dates) * len(TRADING_HOURS) entries
+    """
+    days = dates.to_numpy(dtype="datetime64[D]").astype("datetime64[m]")
+    offsets = np.array(
+        [t.hour * 60 + t.minute for t in TRADING_HOURS], dtype="timedelta64[m]"
+    )
+    local_times = (days[:, None] + offsets[None, :]).reshape(-1)
+    return pd.DatetimeIndex(
+        local_times.astype("datetime64[ns]"), name="timestamp"
+    ).tz_localize("US/Eastern")
+
+
+def _interpolate_hourly(daily: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolate daily closes across the trading hours.
+
+    The last day has no next close, so it just repeats its own values.
+
+    Args:
+        daily: Daily closing values, shape [days, series]
+
+    Returns:
+        float32 array of shape [days * hours, series]
+    """
+    n_days, n_series = daily.shape
+    n_hours = len(TRADING_HOURS)
+    step = np.vstack([daily[1:], daily[-1:]]) - daily
+
+    # float32 keeps far more precision than the cents these prices carry and
+    # halves the file size and the bytes the analysis flows read back
+    hourly = np.empty((n_days, n_hours, n_series), dtype=np.float32)
+
+    # Fill one trading hour at a time so no [days, hours, series] float64
+    # intermediate is ever allocated
+    scratch = np.empty_like(step)
+    for h in range(n_hours):
+        np.multiply(step, h / n_hours, out=scratch)
+        np.add(daily, scratch, out=scratch)
+        hourly[:, h, :] = scratch
+    return hourly.reshape(-1, n_series)
+
+
+def _write_parquet(
+    df: pd.DataFrame, output_path: str, row_group_size: Optional[int] = None
+):
+    """
+    Write a generated frame (with its timestamp index) to parquet.
+
+    Args:
+        df: Hourly frame indexed by timestamp
+        output_path: Path to output parquet file
+        row_group_size: Rows per row group (pyarrow's default if None)
+    """
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    # Float columns rarely repeat, so skip the dictionary-encoding pass
+    with pq.ParquetWriter(
+        output_path,
+        table.schema,
+        compression="zstd",
+        compression_level=1,
+        use_dictionary=False,
+        data_page_size=1 << 20,
+    ) as writer:
+        writer.write_table(table, row_group_size=row_group_size)
+
+
+def _is_up_to_date(sources: List[str], *outputs: str) -> bool:
+    """
+    Check whether every output exists and is newer than all of its sources.
 
+    Args:
+        sources: Paths to the input files (including this script)
+        *outputs: Paths to the generated files
 
-def generate_hourly_data(input_csv: str, output_parquet: str):
+    Returns:
+        True if nothing needs to be regenerated
     """
-    Generate hourly stock data from daily CSV and save as parquet.
+    newest_source = max(os.path.getmtime(path) for path in sources)
+    return all(
+        os.path.exists(path) and os.path.getmtime(path) > newest_source
+        for path in outputs
+    )
+
+
+def read_daily_prices(input_csv: str) -> pd.DataFrame:
+    """
+    Read the daily closing-price CSV once for both generators.
 
     Args:
         input_csv: Path to input CSV file with daily prices
-        output_parquet: Path to output parquet file
+
+    Returns:
+        DataFrame with a parsed "date" column, sorted by date, followed by one
+        column per ticker
     """
-    # Read the CSV file
     print(f"Reading {input_csv}...")
-    df = pd.read_csv(input_csv)
+    # Arrow's multithreaded CSV reader parses the floats and the dates in one
+    # pass, straight into columnar buffers
+    table = pacsv.read_csv(input_csv)
 
-    # First column is unnamed and contains dates
-    date_col = df.columns[0]
-    df = df.rename(columns={date_col: "date"})
+    # First column is unnamed and contains dates, which Arrow reads as date32
+    dates = table.column(0).cast(pa.timestamp("ns"))
+    df = table.set_column(0, "date", dates).to_pandas()
+    return df.sort_values("date")
 
-    # Parse dates
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date")
 
+def generate_hourly_data(df: pd.DataFrame, output_parquet: str):
+    """
+    Generate hourly stock data from daily prices and save as parquet.
+
+    Args:
+        df: Daily prices from read_daily_prices
+        output_parquet: Path to output parquet file
+    """
     print(f"Loaded {len(df)} days of data for {len(df.columns) - 1} stocks")
 
-    # Define trading hours in EST
-    est = pytz.timezone("US/Eastern")
-    trading_hours = [
-        time(9, 30),  # Market open
-        time(10, 30),
-        time(11, 30),
-        time(12, 30),
-        time(13, 30),
-        time(14, 30),
-        time(15, 30),
-        time(16, 0),  # Market close
-    ]
-
-    # Create hourly data
-    hourly_records = []
     stock_columns = [col for col in df.columns if col != "date"]
 
     print("Generating hourly data with linear interpolation...")
 
-    for i in range(len(df)):
-        date = df.iloc[i]["date"]
-
-        # Get current day's values
-        current_values = df.iloc[i][stock_columns].values
-
-        # Get next day's values for interpolation (if available)
-        if i < len(df) - 1:
-            next_values = df.iloc[i + 1][stock_columns].values
-        else:
-            # For the last day, just use current values
-            next_values = current_values
-
-        # Generate hourly timestamps and interpolated values
-        for hour_idx, trading_time in enumerate(trading_hours):
-            # Create timezone-aware timestamp
-            timestamp = est.localize(datetime.combine(date.date(), trading_time))
-
-            # Calculate interpolation factor (0 at market open, 1 at next day's market open)
-            # We assume the daily price is the closing price at 4:00 PM
-            if i < len(df) - 1:
-                # Interpolate between today's close and tomorrow's close
-                # Within the trading day, progress from today's close towards tomorrow's close
-                interp_factor = hour_idx / len(trading_hours)
-                interpolated_values = (
-                    current_values + (next_values - current_values) * interp_factor
-                )
-            else:
-                # Last day: just use current values
-                interpolated_values = current_values
-
-            # Create record
-            record = {"timestamp": timestamp}
-            for col_idx, col_name in enumerate(stock_columns):
-                record[col_name] = interpolated_values[col_idx]
-
-            hourly_records.append(record)
-
-    # Create DataFrame from hourly records
-    hourly_df = pd.DataFrame(hourly_records)
-    hourly_df = hourly_df.set_index("timestamp")
+    # We assume the daily price is the closing price at 4:00 PM; within each
+    # trading day, progress from today's close towards tomorrow's close
+    prices = df[stock_columns].to_numpy(dtype=np.float64)  # [days, stocks]
+    hourly_values = _interpolate_hourly(prices)
+
+    # Wrap the interpolated matrix directly rather than copying it
+    hourly_df = pd.DataFrame(
+        hourly_values,
+        index=_hourly_index(df["date"]),
+        columns=stock_columns,
+        copy=False,
+    )
 
     print(f"Generated {len(hourly_df)} hourly records")
 
     # Save to parquet
     print(f"Saving to {output_parquet}...")
-    hourly_df.to_parquet(output_parquet, engine="pyarrow", compression="snappy")
+    _write_parquet(hourly_df, output_parquet)
 
     print("Done!")
     print(f"\nOutput statistics:")
@@ -108,94 +190,55 @@ def generate_hourly_data(input_csv: str, output_parquet: str):
     print(f"  - File size: {output_parquet}")
 
 
-def generate_market_indices(input_csv: str, output_vix: str, output_spx: str):
+def generate_market_indices(df: pd.DataFrame, output_vix: str, output_spx: str):
     """
-    Generate hourly VIX and SPX index data from daily CSV.
+    Generate hourly VIX and SPX index data from daily prices.
 
     Args:
-        input_csv: Path to input CSV file with daily prices (must contain SPX column)
+        df: Daily prices from read_daily_prices (must contain SPX column)
         output_vix: Path to output VIX parquet file
         output_spx: Path to output SPX parquet file
     """
-    # Read the CSV file
-    print(f"\nGenerating market indices from {input_csv}...")
-    df = pd.read_csv(input_csv)
-
-    # First column is unnamed and contains dates
-    date_col = df.columns[0]
-    df = df.rename(columns={date_col: "date"})
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date")
-
-    # Define trading hours in EST
-    est = pytz.timezone("US/Eastern")
-    trading_hours = [
-        time(9, 30),
-        time(10, 30),
-        time(11, 30),
-        time(12, 30),
-        time(13, 30),
-        time(14, 30),
-        time(15, 30),
-        time(16, 0),
-    ]
-
-    # Generate SPX hourly data (extract from input CSV)
+    print("\nGenerating market indices...")
+
+    # Generate SPX hourly data (extract from input CSV), interpolated the same
+    # way as the stock prices
     print("Generating SPX hourly data...")
-    spx_records = []
-
-    for i in range(len(df)):
-        date = df.iloc[i]["date"]
-        current_spx = df.iloc[i]["SPX"]
-        next_spx = df.iloc[i + 1]["SPX"] if i < len(df) - 1 else current_spx
-
-        for hour_idx, trading_time in enumerate(trading_hours):
-            timestamp = est.localize(datetime.combine(date.date(), trading_time))
-            interp_factor = hour_idx / len(trading_hours)
-            interpolated_spx = current_spx + (next_spx - current_spx) * interp_factor
-            spx_records.append({"timestamp": timestamp, "SPX": interpolated_spx})
-
-    spx_df = pd.DataFrame(spx_records)
-    spx_df = spx_df.set_index("timestamp")
-    spx_df.to_parquet(output_spx, engine="pyarrow", compression="snappy")
+    spx = df["SPX"].to_numpy(dtype=np.float64)
+    hourly_spx = _interpolate_hourly(spx[:, None]).reshape(-1)
+    timestamps = _hourly_index(df["date"])
+    spx_df = pd.DataFrame(
+        {"SPX": hourly_spx},
+        index=timestamps,
+        copy=False,
+    )
+    _write_parquet(spx_df, output_spx, row_group_size=INDEX_ROW_GROUP_SIZE)
     print(f"Saved SPX data to {output_spx} ({len(spx_df)} records)")
 
     # Generate simulated VIX data (volatility index)
     # VIX typically ranges from 10-40, with mean around 15-20
     print("Generating simulated VIX hourly data...")
-    np.random.seed(42)  # For reproducibility
+    rng = np.random.default_rng(42)  # For reproducibility
 
-    vix_records = []
     base_vix = 18.0  # Base volatility level
-
-    for i in range(len(df)):
-        date = df.iloc[i]["date"]
-
-        # Calculate daily volatility based on SPX movements
-        if i > 0:
-            spx_change_pct = (
-                abs((df.iloc[i]["SPX"] - df.iloc[i - 1]["SPX"]) / df.iloc[i - 1]["SPX"])
-                * 100
-            )
-            # Higher SPX changes correlate with higher VIX
-            daily_vix = base_vix + spx_change_pct * 5 + np.random.normal(0, 2)
-        else:
-            daily_vix = base_vix + np.random.normal(0, 2)
-
-        # Ensure VIX stays in realistic range (10-50)
-        daily_vix = max(10, min(50, daily_vix))
-
-        # Generate hourly values with some intraday variation
-        for hour_idx, trading_time in enumerate(trading_hours):
-            timestamp = est.localize(datetime.combine(date.date(), trading_time))
-            # Add intraday noise
-            hourly_vix = daily_vix + np.random.normal(0, 1.5)
-            hourly_vix = max(10, min(50, hourly_vix))
-            vix_records.append({"timestamp": timestamp, "VIX": hourly_vix})
-
-    vix_df = pd.DataFrame(vix_records)
-    vix_df = vix_df.set_index("timestamp")
-    vix_df.to_parquet(output_vix, engine="pyarrow", compression="snappy")
+    n_days, n_hours = len(df), len(TRADING_HOURS)
+
+    # Higher SPX changes correlate with higher VIX (no change on the first day)
+    spx_change_pct = np.zeros(len(df))
+    spx_change_pct[1:] = np.abs(np.diff(spx) / spx[:-1]) * 100
+    daily_vix = base_vix + spx_change_pct * 5 + rng.normal(0, 2, size=n_days)
+
+    # Ensure VIX stays in realistic range (10-50), then add intraday variation
+    daily_vix = np.clip(daily_vix, 10, 50)
+    intraday_noise = rng.normal(0, 1.5, size=(n_days, n_hours))
+    hourly_vix = np.clip(daily_vix[:, None] + intraday_noise, 10, 50)
+
+    vix_df = pd.DataFrame(
+        {"VIX": hourly_vix.reshape(-1).astype(np.float32, copy=False)},
+        index=timestamps,
+        copy=False,
+    )
+    _write_parquet(vix_df, output_vix, row_group_size=INDEX_ROW_GROUP_SIZE)
     print(f"Saved VIX data to {output_vix} ({len(vix_df)} records)")
     print(f"VIX range: {vix_df['VIX'].min():.2f} to {vix_df['VIX'].max():.2f}")
 
@@ -206,8 +249,25 @@ if __name__ == "__main__":
     output_vix_file = "vix_hourly.parquet"
     output_spx_file = "spx_hourly.parquet"
 
+    # Only rebuild outputs that are missing or older than the input CSV or this
+    # script (a generator change alters the output too); --force rebuilds all
+    force = "--force" in sys.argv[1:]
+    sources = [input_file, __file__]
+    hourly_stale = force or not _is_up_to_date(sources, output_file)
+    indices_stale = force or not _is_up_to_date(
+        sources, output_vix_file, output_spx_file
+    )
+    if not (hourly_stale or indices_stale):
+        print("All outputs are up to date, nothing to generate")
+        sys.exit(0)
+
+    # Parse the CSV once and share it between both generators
+    daily_df = read_daily_prices(input_file)
+
     # Generate stock holdings data
-    generate_hourly_data(input_file, output_file)
+    if hourly_stale:
+        generate_hourly_data(daily_df, output_file)
 
     # Generate market indices
-    generate_market_indices(input_file, output_vix_file, output_spx_file)
+    if indices_stale:
+        generate_market_indices(daily_df, output_vix_file, output_spx_file)
@@ -2,15 +2,23 @@
 
 import boto3
 import sys
+from botocore.config import Config
 
 
 REPO_NAME = "se-demos/trading-partition-demo"
 REGION = "us-east-2"
 
+# Resolve credentials once and reuse the client's warm connections
+SESSION = boto3.session.Session(region_name=REGION)
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+
 
 def create_repository():
     """Create ECR repository if it doesn't exist."""
-    ecr = boto3.client("ecr", region_name=REGION)
+    ecr = SESSION.client("ecr", config=CLIENT_CONFIG)
     
     try:
         response = ecr.describe_repositories(repositoryNames=[REPO_NAME])
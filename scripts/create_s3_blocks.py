@@ -1,9 +1,23 @@
 """Create Prefect S3 blocks for input data and results storage."""
 
-from prefect_aws import S3Bucket
+from prefect_aws import AwsCredentials, S3Bucket
+from prefect_aws.client_parameters import AwsClientParameters
 
 BUCKET = "se-demo-raw-data-files"
 
+# upload_data_to_s3.py uploads its 3 data files at once, each with up to 32
+# concurrent part requests, all on the block's one cached S3 client
+MAX_POOL_CONNECTIONS = 3 * 32
+
+# botocore settings for the S3 client each block builds (and caches). The pool
+# covers every concurrent upload request; keepalive and adaptive retries keep
+# long parallel transfers healthy.
+CLIENT_CONFIG = {
+    "max_pool_connections": MAX_POOL_CONNECTIONS,
+    "tcp_keepalive": True,
+    "retries": {"mode": "adaptive", "max_attempts": 5},
+}
+
 def create_s3_blocks():
     """
     Create S3 blocks for the trading demo:
@@ -12,12 +26,16 @@ def create_s3_blocks():
     """
     
     # Note: AWS credentials are picked up from environment or AWS config
-    # No need to explicitly create AwsCredentials block if using default credentials
+    # The inline AwsCredentials only carries client settings, not keys
+    credentials = AwsCredentials(
+        aws_client_parameters=AwsClientParameters(config=CLIENT_CONFIG)
+    )
     
     # Block 1: Input data storage
     input_bucket = S3Bucket(
         bucket_name=BUCKET,
         bucket_folder="",  # Root of bucket for input files
+        credentials=credentials,
     )
     input_bucket.save(name="trading-demo-input", overwrite=True)
     print("✓ Created S3 block: trading-demo-input")
@@ -27,6 +45,7 @@ def create_s3_blocks():
     results_bucket = S3Bucket(
         bucket_name=BUCKET,
         bucket_folder="trading-results",  # Subfolder for results
+        credentials=credentials,
     )
     results_bucket.save(name="trading-demo-results", overwrite=True)
     print("✓ Created S3 block: trading-demo-results")
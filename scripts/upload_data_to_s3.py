@@ -1,9 +1,39 @@
 """Upload parquet data files to S3 using Prefect S3 blocks."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from boto3.s3.transfer import TransferConfig
+from botocore.compat import HAS_CRT
 from prefect_aws import S3Bucket
 
+MB = 1024 * 1024
+
+
+def _crt_supported() -> bool:
+    """Check for an awscrt new enough (0.19.18+) for boto3's CRT transfers."""
+    if not HAS_CRT:
+        return False
+    import awscrt
+
+    try:
+        version = tuple(int(part) for part in awscrt.__version__.split(".")[:3])
+    except ValueError:
+        return False
+    return version >= (0, 19, 18)
+
+
+# Larger parts and more parallel part uploads than boto3's defaults. With a
+# recent awscrt installed, hand transfers to the native CRT client instead of
+# boto3's Python transfer threads.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=64 * MB,
+    max_concurrency=32,
+    use_threads=True,
+    preferred_transfer_client="crt" if _crt_supported() else "classic",
+)
+
 
 FILES = [
     "spx_holdings_hourly.parquet",
@@ -23,12 +53,14 @@ def upload_file(s3_block: S3Bucket, local_path: str, s3_key: str = None):
     if s3_key is None:
         s3_key = path.name
     
-    size_mb = path.stat().st_size / (1024 * 1024)
+    size_mb = path.stat().st_size / MB
     bucket_path = f"{s3_block.bucket_name}/{s3_block.bucket_folder}/{s3_key}".replace("//", "/")
     print(f"Uploading {local_path} ({size_mb:.1f} MB) -> s3://{bucket_path}")
     
     try:
-        s3_block.upload_from_path(from_path=local_path, to_path=s3_key)
+        s3_block.upload_from_path(
+            from_path=local_path, to_path=s3_key, Config=TRANSFER_CONFIG
+        )
         return True
     except Exception as e:
         print(f"Failed: {e}")
@@ -47,7 +79,10 @@ def main():
     bucket_path = f"{s3_block.bucket_name}/{s3_block.bucket_folder}".rstrip("/")
     print(f"Uploading to s3://{bucket_path}/\n")
     
-    uploaded = sum(1 for f in FILES if upload_file(s3_block, f))
+    # Upload all files at once so the total time is that of the largest file
+    with ThreadPoolExecutor(max_workers=len(FILES)) as executor:
+        results = executor.map(lambda f: upload_file(s3_block, f), FILES)
+        uploaded = sum(1 for ok in results if ok)
     
     print(f"\nComplete: {uploaded}/{len(FILES)} files uploaded")
     